@@ -749,7 +749,7 @@ class BattlePanel(Group):
     @battle_data.setter
     def battle_data(self, value: RenderableType) -> None:
         self._battle_data = Panel(value, title="[heading]Battle Data")
-        self._render = list(self._make_renderable())
+        self._render = self._make_renderable()
 
     @property
     def curr_fight(self) -> FightPanel | Literal[""]:
@@ -785,8 +785,10 @@ class CliUi(Live, Ui):
     def __init__(self, match: Match, config: AlgobattleConfig) -> None:
         self.build: BuildView | None = None
         self.battle_panels: dict[Matchup, BattlePanel] = {}
+        self._shown_results: dict[Matchup, str] = {}
         self.match = match
         self.config = config
+        self._title = f"[orange1]Algobattle {pkg_version('algobattle_base')}"
         super().__init__(None, refresh_per_second=10, transient=True, console=console)
 
     def __enter__(self) -> Self:
@@ -797,7 +799,7 @@ class CliUi(Live, Ui):
             renderable = Group(self.display_match(self.match, self.config.match), *self.battle_panels.values())
         else:
             renderable = self.build
-        self.update(Panel(renderable, title=f"[orange1]Algobattle {pkg_version('algobattle_base')}"))
+        self.update(Panel(renderable, title=self._title))
 
     @staticmethod
     def display_match(match: Match, config: MatchConfig) -> RenderableType:
@@ -906,7 +908,12 @@ class CliUi(Live, Ui):
         self.battle_panels[matchup].battle_data = Group(
             *(f"[orchid]{key}[/]: [info]{value}" for key, value in data.model_dump().items())
         )
-        self._update_renderable()
+        # the panel is updated in place, we only need to rebuild the overview if this battle's result changed
+        battle = self.match.battles[MatchupStr.make(matchup)]
+        result = battle.format_score(battle.score(self.config.match.battle))
+        if self._shown_results.get(matchup) != result:
+            self._shown_results[matchup] = result
+            self._update_renderable()
 
 
 if __name__ == "__main__":
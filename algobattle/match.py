@@ -167,6 +167,7 @@ class Match(BaseModel):
             return points
 
         points_per_matchup = round(total_points_per_team / (len(self.active_teams) - 1), 1)
+        battle_config = self.config.match.battle
 
         for first, second in combinations(self.active_teams, 2):
             try:
@@ -174,16 +175,16 @@ class Match(BaseModel):
                 second_res = self.battles[MatchupStr(first, second)]
             except KeyError:
                 continue
-            total_score = max(0, first_res.score(self.config.match.battle)) + max(
-                0, second_res.score(self.config.match.battle)
-            )
+            first_score = first_res.score(battle_config)
+            second_score = second_res.score(battle_config)
+            total_score = max(0, first_score) + max(0, second_score)
             if total_score == 0:
                 # Default values for proportions, assuming no team manages to solve anything
                 first_ratio = 0.5
                 second_ratio = 0.5
             else:
-                first_ratio = first_res.score(self.config.match.battle) / total_score
-                second_ratio = second_res.score(self.config.match.battle) / total_score
+                first_ratio = first_score / total_score
+                second_ratio = second_score / total_score
 
             points[first] += round(points_per_matchup * first_ratio, 1)
             points[second] += round(points_per_matchup * second_ratio, 1)
@@ -625,6 +626,8 @@ class ProjectConfig(BaseModel):
 
     parallel_battles: int = 1
     """Number of battles exectuted in parallel."""
+    parallel_builds: int = Field(default=1, ge=1)
+    """Number of teams whose programs are built in parallel."""
     name_images: bool = True
     """Whether to give the docker images names."""
     cleanup_images: bool = False
@@ -714,4 +717,5 @@ class AlgobattleConfig(BaseModel):
             solver=self.match.solver,
             name_images=self.project.name_images,
             cleanup_images=self.project.cleanup_images,
+            parallel_builds=self.project.parallel_builds,
         )
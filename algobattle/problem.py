@@ -297,6 +297,7 @@ class Problem:
 
     __slots__ = ("name", "instance_cls", "solution_cls", "min_size", "with_solution", "score_function", "test_instance")
     _problems: ClassVar[dict[str, Self]] = {}
+    _file_problems: ClassVar[dict[tuple[Path, int], dict[str, Self]]] = {}
 
     @overload
     def score(self, instance: InstanceT, *, solution: Solution[InstanceT]) -> float:
@@ -342,17 +343,27 @@ class Problem:
 
     @classmethod
     def load_file(cls, name: str, file: Path) -> Self:
-        """Loads the problem from the specified file."""
-        existing_problems = cls._problems.copy()
-        cls._problems = {}
+        """Loads the problem from the specified file.
+
+        The problems defined in a file are cached, it is only imported again if it has been modified since.
+        """
         try:
-            import_file_as_module(file, "__algobattle_problem__")
-            if name not in cls._problems:
-                raise ValueError(f"The {name} problem is not defined in {file}")
-            else:
-                return cls._problems[name]
-        finally:
-            cls._problems = existing_problems
+            key = (file.resolve(), file.stat().st_mtime_ns)
+        except FileNotFoundError as e:
+            raise ValueError(f"The problem file {file} does not exist.") from e
+        if key not in cls._file_problems:
+            existing_problems = cls._problems.copy()
+            cls._problems = {}
+            try:
+                import_file_as_module(file, "__algobattle_problem__")
+                cls._file_problems[key] = cls._problems
+            finally:
+                cls._problems = existing_problems
+        problems = cls._file_problems[key]
+        if name not in problems:
+            raise ValueError(f"The {name} problem is not defined in {file}")
+        else:
+            return problems[name]
 
     @classmethod
     def load(cls, name: str, file: Path | None = None) -> Self:
@@ -4,15 +4,29 @@ from contextlib import contextmanager
 from itertools import combinations
 from os import environ
 from pathlib import Path
+from stat import S_ISDIR
 from tarfile import TarFile, is_tarfile
 from tempfile import TemporaryDirectory
-from timeit import default_timer
+from time import perf_counter
 from types import EllipsisType
-from typing import Any, ClassVar, Iterable, Iterator, Mapping, Protocol, Self, TypeVar, cast, Generator as PyGenerator
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Protocol,
+    Self,
+    TypeVar,
+    cast,
+    Generator as PyGenerator,
+)
 from typing_extensions import TypedDict
 from uuid import uuid4
 import json
 from dataclasses import dataclass, field
+from functools import cached_property
 from zipfile import ZipFile, is_zipfile
 
 from docker import DockerClient
@@ -21,7 +35,7 @@ from docker.models.images import Image as DockerImage
 from docker.models.containers import Container as DockerContainer
 from docker.types import Mount
 from requests import Timeout, ConnectionError
-from anyio import run as run_async
+from anyio import CapacityLimiter, create_task_group, run as run_async
 from anyio.to_thread import run_sync
 from urllib3.exceptions import ReadTimeoutError
 
@@ -48,15 +62,15 @@ T = TypeVar("T")
 
 
 def client() -> DockerClient:
-    """Returns the docker api client, checking that it's still responsive."""
+    """Returns the docker api client, connecting to the daemon on first use."""
     global _client_var
-    try:
-        if _client_var is None:
+    # creating the client already negotiates the api version with the daemon, so there's no need to ping it on every
+    # call, a daemon that stops responding later will surface as an error in the request that is being made
+    if _client_var is None:
+        try:
             _client_var = DockerClient.from_env()
-        else:
-            _client_var.ping()
-    except (DockerException, APIError):
-        raise DockerNotRunning
+        except (DockerException, APIError):
+            raise DockerNotRunning
     return _client_var
 
 
@@ -99,6 +113,7 @@ class ProgramConfigView:
     solver: RunConfigView
     name_images: bool
     cleanup_images: bool
+    parallel_builds: int
 
 
 class ProgramUi(Protocol):
@@ -129,12 +144,12 @@ class ProgramIO:
         self._input = TemporaryDirectory(dir=self.parent_dir)
         self._output = TemporaryDirectory(dir=self.parent_dir)
 
-    @property
+    @cached_property
     def input(self) -> Path:
         """Path to the input directory."""
         return Path(self._input.name)
 
-    @property
+    @cached_property
     def output(self) -> Path:
         """Path to the output directoy."""
         return Path(self._output.name)
@@ -208,9 +223,11 @@ class Program(ABC):
     @contextmanager
     def _setup_docker_env(cls, source: Path) -> PyGenerator[tuple[Path, str | None], None, None]:
         """Creates a folder containing the actual docker environment used to build a program."""
-        if not source.exists():
+        try:
+            mode = source.stat().st_mode
+        except OSError:
             raise ValueError
-        if source.is_dir():
+        if S_ISDIR(mode):
             yield source, None
             return
         if source.name == "Dockerfile" or source.suffix == ".dockerfile":
@@ -426,11 +443,11 @@ class Program(ABC):
         # this method has to be a thicker wrapper since we have to kill the container asap, not just when the
         # async manager gives us back control.
         container.start()
-        start_time = default_timer()
+        start_time = perf_counter()
         elapsed_time = 0
         try:
             response = cast(dict[str, Any], container.wait(timeout=timeout))
-            elapsed_time = round(default_timer() - start_time, 2)
+            elapsed_time = round(perf_counter() - start_time, 2)
             if response["StatusCode"] == 0:
                 return elapsed_time
             else:
@@ -441,7 +458,7 @@ class Program(ABC):
                 )
         except (Timeout, ConnectionError) as e:
             container.kill()
-            elapsed_time = round(default_timer() - start_time, 2)
+            elapsed_time = round(perf_counter() - start_time, 2)
             if len(e.args) != 1 or not isinstance(e.args[0], ReadTimeoutError):
                 raise
             if self.config.strict_timeouts:
@@ -768,17 +785,12 @@ class Team:
         self.solver.remove()
 
 
-@dataclass(frozen=True)
-class Matchup:
+class Matchup(NamedTuple):
     """Represents an individual matchup of teams."""
 
     generator: Team
     solver: Team
 
-    def __iter__(self) -> Iterator[Team]:
-        yield self.generator
-        yield self.solver
-
     def __repr__(self) -> str:
         return f"Matchup({self.generator.name}, {self.solver.name})"
 
@@ -804,7 +816,7 @@ class TeamHandler:
         """Builds the programs of every team.
 
         Attempts to build the programs of every team. If any build fails, that team will be excluded and all its
-        programs cleaned up.
+        programs cleaned up. Up to `config.parallel_builds` teams are built at the same time.
 
         Args:
             infos: Teams that participate in the match.
@@ -815,16 +827,34 @@ class TeamHandler:
             :class:`TeamHandler` containing the info about the participating teams.
         """
         handler = cls()
+        built: dict[str, Team] = {}
+        docker_error: DockerNotRunning | None = None
+        limiter = CapacityLimiter(config.parallel_builds)
         ui.start_build_step(infos.keys(), config.build_timeout)
-        for name, info in infos.items():
-            try:
-                team = await Team.build(name, info, problem, config, ui)
-                handler.active.append(team)
-            except Exception as e:
-                handler.excluded[name] = ExceptionInfo.from_exception(e)
-                ui.finish_build(name, False)
-            else:
-                ui.finish_build(name, True)
+
+        async def build_team(name: str, info: _TeamInfo) -> None:
+            nonlocal docker_error
+            async with limiter:
+                try:
+                    built[name] = await Team.build(name, info, problem, config, ui)
+                except DockerNotRunning as e:
+                    # none of the other builds can succeed either, and the error needs to reach the caller as is
+                    # rather than wrapped in an exception group
+                    docker_error = e
+                    tg.cancel_scope.cancel()
+                except Exception as e:
+                    handler.excluded[name] = ExceptionInfo.from_exception(e)
+                    ui.finish_build(name, False)
+                else:
+                    ui.finish_build(name, True)
+
+        async with create_task_group() as tg:
+            for name, info in infos.items():
+                tg.start_soon(build_team, name, info)
+        if docker_error is not None:
+            raise docker_error
+        # keep the teams in the order they were specified in, regardless of which build finished first
+        handler.active = [built[name] for name in infos if name in built]
         return handler
 
     def __enter__(self) -> Self:
@@ -842,7 +872,7 @@ class TeamHandler:
 
         Each tuple's first matchup has the first team in the group generating, the second has it solving.
         """
-        return [(Matchup(*g), Matchup(*g[::-1])) for g in combinations(self.active, 2)]
+        return [(Matchup(a, b), Matchup(b, a)) for a, b in combinations(self.active, 2)]
 
     @property
     def matchups(self) -> list[Matchup]:
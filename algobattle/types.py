@@ -525,7 +525,6 @@ class EdgeWeights(DirectedGraph, BaseModel, Generic[Weight]):
         """Iterate over all edges and their weights."""
         return zip(self.edges, self.edge_weights)
 
-    @cache
     def weight(self, edge: Edge | tuple[Vertex, Vertex]) -> Weight:
         """Returns the weight of an edge.
 
@@ -539,9 +538,9 @@ class EdgeWeights(DirectedGraph, BaseModel, Generic[Weight]):
                     try:
                         edge = self.edges.index((edge[1], edge[0]))
                     except ValueError:
-                        raise KeyError
+                        raise KeyError(edge) from None
                 else:
-                    raise KeyError
+                    raise KeyError(edge) from None
 
         return self.edge_weights[edge]
 
@@ -103,8 +103,7 @@ class EncodableModelBase(BaseModel, EncodableBase, ABC):
         if not source.with_suffix(".json").is_file():
             raise EncodingError("The json file does not exist.")
         try:
-            with open(source.with_suffix(".json"), "r") as f:
-                return model_cls.model_validate_json(f.read(), context=context)
+            return model_cls.model_validate_json(source.with_suffix(".json").read_bytes(), context=context)
         except PydanticValidationError as e:
             raise EncodingError("Json data does not fit the schema.", detail=str(e))
         except Exception as e:
@@ -113,8 +112,7 @@ class EncodableModelBase(BaseModel, EncodableBase, ABC):
     def encode(self, target: Path, role: Role) -> None:
         """Uses pydantic to create a json representation of the object at the targeted file."""
         try:
-            with open(target.with_suffix(".json"), "w") as f:
-                f.write(self.model_dump_json())
+            target.with_suffix(".json").write_bytes(self.model_dump_json().encode())
         except Exception as e:
             raise EncodingError("Unkown error while encoding the data.", detail=str(e))
 
@@ -2,19 +2,38 @@
 from unittest import IsolatedAsyncioTestCase, main as run_tests
 from pathlib import Path
 
-from algobattle.program import Generator, Solver
+from anyio import create_task_group, run as run_async
+
+from algobattle.program import Generator, ProgramConfigView, Solver
 from algobattle.match import AlgobattleConfig, MatchConfig, RunConfig
+from algobattle.util import DockerNotRunning
 from . import testsproblem
 from .testsproblem.problem import TestProblem, TestInstance, TestSolution
 
 
+PROBLEM_PATH = Path(testsproblem.__file__).parent
+GENERATORS = (
+    "generator",
+    "generator_timeout",
+    "generator_execution_error",
+    "generator_syntax_error",
+    "generator_semantics_error",
+)
+SOLVERS = (
+    "solver",
+    "solver_timeout",
+    "solver_execution_error",
+    "solver_syntax_error",
+    "solver_semantics_error",
+)
+
+
 class ProgramTests(IsolatedAsyncioTestCase):
     """Tests for the Program functions."""
 
     @classmethod
     def setUpClass(cls) -> None:
         """Set up the config and problem objects."""
-        cls.problem_path = Path(testsproblem.__file__).parent
         cls.config = AlgobattleConfig(match=MatchConfig(problem="Test Problem")).as_prog_config()
         cls.config_short = AlgobattleConfig(
             match=MatchConfig(problem="Test Problem", generator=RunConfig(timeout=2), solver=RunConfig(timeout=2))
@@ -28,112 +47,116 @@ class ProgramTests(IsolatedAsyncioTestCase):
             )
         ).as_prog_config()
         cls.instance = TestInstance(semantics=True)
+        cls.solution = TestSolution(semantics=True, quality=True)
+        try:
+            cls.images = run_async(cls.build_images)
+        except* DockerNotRunning as e:
+            # DockerNotRunning is not an Exception, unittest would abort the whole run instead of reporting the error
+            raise RuntimeError("Could not connect to the Docker daemon.") from e
+
+    @classmethod
+    async def build_images(cls) -> dict[str, str]:
+        """Builds every test program once so that the individual tests only need to run them."""
+        images: dict[str, str] = {}
+
+        async def build(program_cls: type[Generator] | type[Solver], name: str) -> None:
+            program = await program_cls.build(PROBLEM_PATH / name, problem=TestProblem, config=cls.config)
+            images[name] = program.id
+
+        async with create_task_group() as tg:
+            for name in GENERATORS:
+                tg.start_soon(build, Generator, name)
+            for name in SOLVERS:
+                tg.start_soon(build, Solver, name)
+        return images
+
+    def generator(self, name: str, config: ProgramConfigView | None = None) -> Generator:
+        """Creates a generator using the already built image."""
+        return Generator(self.images[name], problem=TestProblem, config=config or self.config)
+
+    def solver(self, name: str, config: ProgramConfigView | None = None) -> Solver:
+        """Creates a solver using the already built image."""
+        return Solver(self.images[name], problem=TestProblem, config=config or self.config)
 
     async def test_gen_lax_timeout(self):
         """The generator times out but still outputs a valid instance."""
-        with await Generator.build(
-            path=self.problem_path / "generator_timeout", problem=TestProblem, config=self.config_short
-        ) as gen:
-            res = await gen.run(5)
-            self.assertIsNone(res.error)
+        gen = self.generator("generator_timeout", self.config_short)
+        res = await gen.run(5)
+        self.assertIsNone(res.error)
 
     async def test_gen_strict_timeout(self):
         """The generator times out."""
-        with await Generator.build(
-            path=self.problem_path / "generator_timeout",
-            problem=TestProblem,
-            config=self.config_strict,
-        ) as gen:
-            res = await gen.run(5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "ExecutionTimeout")
+        gen = self.generator("generator_timeout", self.config_strict)
+        res = await gen.run(5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "ExecutionTimeout")
 
     async def test_gen_exec_err(self):
         """The generator doesn't execute properly."""
-        with await Generator.build(
-            path=self.problem_path / "generator_execution_error", problem=TestProblem, config=self.config
-        ) as gen:
-            res = await gen.run(5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "ExecutionError")
+        gen = self.generator("generator_execution_error")
+        res = await gen.run(5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "ExecutionError")
 
     async def test_gen_syn_err(self):
         """The generator outputs a syntactically incorrect solution."""
-        with await Generator.build(
-            path=self.problem_path / "generator_syntax_error", problem=TestProblem, config=self.config
-        ) as gen:
-            res = await gen.run(5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "EncodingError")
+        gen = self.generator("generator_syntax_error")
+        res = await gen.run(5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "EncodingError")
 
     async def test_gen_sem_err(self):
         """The generator outputs a semantically incorrect solution."""
-        with await Generator.build(
-            path=self.problem_path / "generator_semantics_error", problem=TestProblem, config=self.config
-        ) as gen:
-            res = await gen.run(5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "ValidationError")
+        gen = self.generator("generator_semantics_error")
+        res = await gen.run(5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "ValidationError")
 
     async def test_gen_succ(self):
         """The generator returns the fixed instance."""
-        with await Generator.build(
-            path=self.problem_path / "generator", problem=TestProblem, config=self.config
-        ) as gen:
-            res = await gen.run(5)
-            correct = TestInstance(semantics=True)
-            self.assertEqual(res.instance, correct)
+        gen = self.generator("generator")
+        res = await gen.run(5)
+        self.assertEqual(res.instance, self.instance)
 
     async def test_sol_strict_timeout(self):
         """The solver times out."""
-        with await Solver.build(
-            path=self.problem_path / "solver_timeout", problem=TestProblem, config=self.config_strict
-        ) as sol:
-            res = await sol.run(self.instance, 5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "ExecutionTimeout")
+        sol = self.solver("solver_timeout", self.config_strict)
+        res = await sol.run(self.instance, 5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "ExecutionTimeout")
 
     async def test_sol_lax_timeout(self):
         """The solver times out but still outputs a correct solution."""
-        with await Solver.build(
-            path=self.problem_path / "solver_timeout", problem=TestProblem, config=self.config_short
-        ) as sol:
-            res = await sol.run(self.instance, 5)
-            self.assertIsNone(res.error)
+        sol = self.solver("solver_timeout", self.config_short)
+        res = await sol.run(self.instance, 5)
+        self.assertIsNone(res.error)
 
     async def test_sol_exec_err(self):
         """The solver doesn't execute properly."""
-        with await Solver.build(
-            path=self.problem_path / "solver_execution_error", problem=TestProblem, config=self.config
-        ) as sol:
-            res = await sol.run(self.instance, 5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "ExecutionError")
+        sol = self.solver("solver_execution_error")
+        res = await sol.run(self.instance, 5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "ExecutionError")
 
     async def test_sol_syn_err(self):
         """The solver outputs a syntactically incorrect solution."""
-        with await Solver.build(
-            path=self.problem_path / "solver_syntax_error", problem=TestProblem, config=self.config
-        ) as sol:
-            res = await sol.run(self.instance, 5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "EncodingError")
+        sol = self.solver("solver_syntax_error")
+        res = await sol.run(self.instance, 5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "EncodingError")
 
     async def test_sol_sem_err(self):
         """The solver outputs a semantically incorrect solution."""
-        with await Solver.build(
-            path=self.problem_path / "solver_semantics_error", problem=TestProblem, config=self.config
-        ) as sol:
-            res = await sol.run(self.instance, 5)
-            assert res.error is not None
-            self.assertEqual(res.error.type, "ValidationError")
+        sol = self.solver("solver_semantics_error")
+        res = await sol.run(self.instance, 5)
+        assert res.error is not None
+        self.assertEqual(res.error.type, "ValidationError")
 
     async def test_sol_succ(self):
         """The solver outputs a solution with a low quality."""
-        with await Solver.build(path=self.problem_path / "solver", problem=TestProblem, config=self.config) as sol:
-            res = await sol.run(self.instance, 5)
-            correct = TestSolution(semantics=True, quality=True)
-            self.assertEqual(res.solution, correct)
+        sol = self.solver("solver")
+        res = await sol.run(self.instance, 5)
+        self.assertEqual(res.solution, self.solution)
 
 
 if __name__ == "__main__":
@@ -2,13 +2,16 @@
 # pyright: reportMissingSuperCall=false
 from typing import Any
 from unittest import IsolatedAsyncioTestCase, TestCase, main
+from unittest.mock import patch
 from pathlib import Path
 
+from anyio import sleep
 from pydantic import ByteSize, ValidationError
 
 from algobattle.battle import Fight, Iterated, Averaged, ProgramRunInfo
 from algobattle.match import (
     DynamicProblemConfig,
+    EmptyUi,
     MatchupStr,
     ProjectConfig,
     Match,
@@ -17,7 +20,9 @@ from algobattle.match import (
     RunConfig,
     TeamInfo,
 )
+from algobattle.problem import Problem
 from algobattle.program import Team, Matchup, TeamHandler
+from algobattle.util import DockerNotRunning
 from .testsproblem.problem import TestProblem
 
 
@@ -162,6 +167,58 @@ class Matchtests(TestCase):
     # TODO: Add tests for remaining functions
 
 
+class TeamBuilding(IsolatedAsyncioTestCase):
+    """Tests for building all teams of a match, without relying on docker."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = AlgobattleConfig(
+            match=MatchConfig(problem="Test Problem"), project=ProjectConfig(parallel_builds=3)
+        ).as_prog_config()
+        cls.infos = {name: TeamInfo(generator=Path(), solver=Path()) for name in ("first", "second", "third")}
+
+    async def build(self, build_team: Any) -> TeamHandler:
+        with patch.object(Team, "build", new=build_team):
+            return await TeamHandler.build(self.infos, TestProblem, self.config, EmptyUi())
+
+    async def test_order(self):
+        """Teams are active in config order even if their builds finish in a different one."""
+        delays = {"first": 0.1, "second": 0.05, "third": 0}
+
+        async def build_team(name: str, *args: Any) -> Team:
+            await sleep(delays[name])
+            return TestTeam(name)
+
+        handler = await self.build(build_team)
+        self.assertEqual([team.name for team in handler.active], ["first", "second", "third"])
+        self.assertEqual(handler.excluded, {})
+
+    async def test_failed_build(self):
+        """Teams whose build fails are excluded."""
+
+        async def build_team(name: str, *args: Any) -> Team:
+            if name == "second":
+                raise RuntimeError
+            return TestTeam(name)
+
+        handler = await self.build(build_team)
+        self.assertEqual([team.name for team in handler.active], ["first", "third"])
+        self.assertEqual(list(handler.excluded), ["second"])
+
+    async def test_docker_not_running(self):
+        """A missing docker daemon reaches the caller as is."""
+
+        async def build_team(name: str, *args: Any) -> Team:
+            raise DockerNotRunning
+
+        with self.assertRaises(DockerNotRunning):
+            await self.build(build_team)
+
+    def test_parallel_builds_positive(self):
+        with self.assertRaises(ValidationError):
+            ProjectConfig(parallel_builds=0)
+
+
 class Execution(IsolatedAsyncioTestCase):
     """Some basic tests for the execution of the battles."""
 
@@ -276,6 +333,14 @@ class Parsing(TestCase):
         with self.assertRaises(ValueError):
             AlgobattleConfig.from_file(self.configs_path / "teams_incorrect.toml")
 
+    def test_problem_file_cached(self):
+        problem = Problem.load_file("Test Problem", self.problem_path / "problem.py")
+        self.assertIs(Problem.load_file("Test Problem", self.problem_path / "problem.py"), problem)
+
+    def test_problem_file_missing(self):
+        with self.assertRaises(ValueError):
+            Problem.load_file("Test Problem", self.problem_path / "missing.py")
+
 
 if __name__ == "__main__":
     main()
@@ -7,7 +7,16 @@ from pydantic import ValidationError
 
 from algobattle.problem import InstanceModel, AttributeReference, SelfRef
 from algobattle.util import Role
-from algobattle.types import Ge, Interval, LaxComp, SizeIndex, UniqueItems
+from algobattle.types import (
+    DirectedGraph,
+    EdgeWeights,
+    Ge,
+    Interval,
+    LaxComp,
+    SizeIndex,
+    UndirectedGraph,
+    UniqueItems,
+)
 
 
 class ModelCreationTests(TestCase):
@@ -327,5 +336,48 @@ class LaxCompTests(TestCase):
         self.assertNotLessEqual(160, LaxComp(100, Role.solver))
 
 
+class EdgeWeightTests(TestCase):
+    """Tests for looking up edge weights."""
+
+    def test_directed(self):
+        class Graph(EdgeWeights[int], DirectedGraph):
+            pass
+
+        graph = Graph(num_vertices=3, edges=[(0, 1), (1, 2)], edge_weights=[5, 7])
+        self.assertEqual(graph.weight((1, 2)), 7)
+        self.assertEqual(graph.weight(0), 5)
+        with self.assertRaises(KeyError):
+            graph.weight((2, 1))
+
+    def test_undirected(self):
+        class Graph(EdgeWeights[int], UndirectedGraph):
+            pass
+
+        graph = Graph(num_vertices=3, edges=[(0, 1), (1, 2)], edge_weights=[5, 7])
+        self.assertEqual(graph.weight((0, 1)), 5)
+        self.assertEqual(graph.weight((2, 1)), 7)
+        with self.assertRaises(KeyError):
+            graph.weight((0, 2))
+
+    def test_equality_after_lookup(self):
+        class Graph(EdgeWeights[int], DirectedGraph):
+            pass
+
+        graph = Graph(num_vertices=3, edges=[(0, 1), (1, 2)], edge_weights=[5, 7])
+        other = Graph(num_vertices=3, edges=[(0, 1), (1, 2)], edge_weights=[5, 7])
+        graph.weight((0, 1))
+        self.assertEqual(graph, other)
+
+    def test_model_copy(self):
+        class Graph(EdgeWeights[int], DirectedGraph):
+            pass
+
+        graph = Graph(num_vertices=3, edges=[(0, 1), (1, 2)], edge_weights=[5, 7])
+        self.assertEqual(graph.weight((1, 2)), 7)
+        copy = graph.model_copy(update={"edges": [(1, 2), (0, 1)]})
+        self.assertEqual(copy.weight((1, 2)), 5)
+        self.assertEqual(copy.weight((0, 1)), 7)
+
+
 if __name__ == "__main__":
     main()